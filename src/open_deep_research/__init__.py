@@ -2,28 +2,47 @@
 
 __version__ = "0.0.15"
 
-# Import the graph from the graph.py file
-from open_deep_research.graph import graph as linear_graph
-from open_deep_research.multi_agent import graph as multi_agent_graph
-from open_deep_research.graph_workflow import graph as graph_based_research
+import importlib
 
 from open_deep_research.configuration import Configuration, ResearchMode
 
+# Modules providing the compiled graph for each research mode. They are imported
+# on first use so callers only pay for the graphs they actually run.
+_GRAPH_MODULES = {
+    ResearchMode.LINEAR: "open_deep_research.graph",
+    ResearchMode.GRAPH: "open_deep_research.graph_workflow",
+    ResearchMode.MULTI_AGENT: "open_deep_research.multi_agent",
+}
+
+# Lazily resolved module attributes for the compiled graphs
+_GRAPH_EXPORTS = {
+    "linear_graph": ResearchMode.LINEAR,
+    "graph_based_research": ResearchMode.GRAPH,
+    "multi_agent_graph": ResearchMode.MULTI_AGENT,
+}
+
+def _load_graph(research_mode: ResearchMode):
+    """Import and return the compiled graph for a research mode."""
+    return importlib.import_module(_GRAPH_MODULES[research_mode]).graph
+
+def __getattr__(name: str):
+    """Resolve the compiled graph exports on first access."""
+    if name in _GRAPH_EXPORTS:
+        return _load_graph(_GRAPH_EXPORTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_research_graph(config: Configuration = None):
     """Get the appropriate research graph based on configuration.
-    
+
     Args:
         config (Configuration, optional): Configuration for the research. Defaults to None.
-        
+
     Returns:
         graph: The compiled research graph
     """
     if not config:
         config = Configuration()
-    
-    if config.research_mode == ResearchMode.GRAPH:
-        return graph_based_research
-    elif config.research_mode == ResearchMode.MULTI_AGENT:
-        return multi_agent_graph
-    else:  # Default to LINEAR mode
-        return linear_graph
+
+    # Default to LINEAR mode
+    research_mode = config.research_mode if config.research_mode in _GRAPH_MODULES else ResearchMode.LINEAR
+    return _load_graph(research_mode)
@@ -46,6 +46,8 @@ class Configuration:
     # Graph-specific configuration
     number_of_queries: int = 2 # Number of search queries to generate per iteration
     max_search_depth: int = 2 # Maximum number of reflection + search iterations
+    max_concurrent_searches: int = 5 # Maximum number of sub-question searches run at once in graph mode
+    max_chars_per_result: Optional[int] = None # Maximum characters kept from each sub-question's search results in graph mode, None for no cap
     planner_provider: str = "anthropic"  # Defaults to Anthropic as provider
     planner_model: str = "claude-3-7-sonnet-latest" # Defaults to claude-3-7-sonnet-latest
     planner_model_kwargs: Optional[Dict[str, Any]] = None # kwargs for planner_model
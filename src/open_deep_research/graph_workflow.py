@@ -1,3 +1,4 @@
+import logging
 from typing import Literal, Dict, Any, List, Optional
 
 from langchain.chat_models import init_chat_model
@@ -6,7 +7,7 @@ from langchain_core.runnables import RunnableConfig
 
 from langgraph.constants import Send
 from langgraph.graph import START, END, StateGraph
-from langgraph.types import interrupt, Command
+from langgraph.types import interrupt, Command, StreamWriter
 
 from open_deep_research.state import (
     ReportStateInput,
@@ -18,13 +19,39 @@ from open_deep_research.utils import get_config_value
 from open_deep_research.research_graph import GraphResearchAgent
 from open_deep_research.visualization import save_graph_visualization
 
+logger = logging.getLogger(__name__)
+
 class GraphResearchState(ReportState):
     """State for the graph-based research workflow."""
     graph_agent: Optional[GraphResearchAgent] = None
     visualization_path: Optional[str] = None
     sub_questions: List[str] = []
+    feedback_on_questions: Optional[str] = None
+    feedback_on_report: Optional[str] = None
     final_report: str = ""
 
+# Feedback used when the previous output is rejected without a comment
+_REJECTION_FEEDBACK = "The previous version was rejected. Produce a different one."
+
+def _coerce_feedback(feedback: Any) -> str:
+    """Turn an interrupt value that is not an approval into feedback text.
+    
+    Values other than strings are accepted rather than failing the run after the
+    interrupt, which would force the completed steps to be replayed on retry.
+    A rejection without a comment becomes an instruction to produce something
+    different, so the regenerated output does not repeat the rejected one.
+    
+    Args:
+        feedback: Value the workflow was resumed with
+        
+    Returns:
+        The feedback text, never empty
+    """
+    if not isinstance(feedback, str):
+        logger.warning("Interrupt value of type %s is not a string; treating it as feedback.", type(feedback).__name__)
+        feedback = "" if feedback is None or isinstance(feedback, bool) else str(feedback)
+    return feedback if feedback.strip() else _REJECTION_FEEDBACK
+
 async def initialize_research_graph(state: GraphResearchState, config: RunnableConfig):
     """Initialize the research graph with the main topic.
     
@@ -58,12 +85,16 @@ async def generate_sub_questions(state: GraphResearchState, config: RunnableConf
     topic = state["topic"]
     graph_agent = state["graph_agent"]
     
-    # Get configuration
-    configurable = Configuration.from_runnable_config(config)
-    num_questions = configurable.number_of_queries
+    # Use the configuration the agent resolved when the workflow started
+    num_questions = graph_agent.configurable.number_of_queries
     
-    # Generate sub-questions
-    sub_questions = await graph_agent.generate_sub_questions(topic, num_questions)
+    # Generate sub-questions, taking any feedback on the previous ones into account.
+    # Submitting the same feedback again reuses the questions it produced, but a
+    # rejection without a comment always asks the model for new ones.
+    feedback = state.get("feedback_on_questions", None)
+    sub_questions = await graph_agent.generate_sub_questions(
+        topic, num_questions, feedback, use_cache=False if feedback == _REJECTION_FEEDBACK else None
+    )
     
     return {"sub_questions": sub_questions}
 
@@ -98,12 +129,9 @@ Or, provide feedback to regenerate the questions:"""
     if isinstance(feedback, bool) and feedback is True:
         return Command(goto="expand_graph_with_questions")
     
-    # If the user provides feedback, regenerate the questions
-    elif isinstance(feedback, str):
-        return Command(goto="generate_sub_questions", 
-                      update={"feedback_on_questions": feedback})
-    else:
-        raise TypeError(f"Interrupt value of type {type(feedback)} is not supported.")
+    # Otherwise treat the value as feedback and regenerate the questions
+    return Command(goto="generate_sub_questions", 
+                  update={"feedback_on_questions": _coerce_feedback(feedback)})
 
 async def expand_graph_with_questions(state: GraphResearchState, config: RunnableConfig):
     """Expand the research graph with the approved sub-questions.
@@ -129,12 +157,16 @@ async def expand_graph_with_questions(state: GraphResearchState, config: Runnabl
     
     return {"graph_agent": graph_agent, "visualization_path": visualization_path}
 
-async def generate_final_response(state: GraphResearchState, config: RunnableConfig):
+async def generate_final_response(state: GraphResearchState, config: RunnableConfig, writer: StreamWriter):
     """Generate the final research response based on all search results.
     
+    The report is streamed as it is written: each new piece is emitted as a
+    {"report_partial": text} event on the "custom" stream mode.
+    
     Args:
         state: Current graph state with the expanded graph
         config: Configuration for models, search APIs, etc.
+        writer: Writer for custom stream events
         
     Returns:
         Dict containing the final report
@@ -142,8 +174,14 @@ async def generate_final_response(state: GraphResearchState, config: RunnableCon
     # Get the graph agent
     graph_agent = state["graph_agent"]
     
-    # Generate the final response
-    final_report = await graph_agent.generate_final_response()
+    # Generate the final response, taking any feedback on the previous one into account.
+    # As for the questions, only new feedback or a bare rejection calls the model again.
+    feedback = state.get("feedback_on_report", None)
+    final_report = await graph_agent.generate_final_response(
+        feedback,
+        use_cache=False if feedback == _REJECTION_FEEDBACK else None,
+        on_partial=lambda text: writer({"report_partial": text}),
+    )
     
     # Update visualization with the final response
     nodes, edges = graph_agent.get_visualization_data()
@@ -180,12 +218,9 @@ Or, provide feedback to regenerate the report:"""
     if isinstance(feedback, bool) and feedback is True:
         return Command(goto=END)
     
-    # If the user provides feedback, regenerate the report
-    elif isinstance(feedback, str):
-        return Command(goto="generate_final_response", 
-                      update={"feedback_on_report": feedback})
-    else:
-        raise TypeError(f"Interrupt value of type {type(feedback)} is not supported.")
+    # Otherwise treat the value as feedback and regenerate the report
+    return Command(goto="generate_final_response", 
+                  update={"feedback_on_report": _coerce_feedback(feedback)})
 
 # Build the graph-based research workflow
 graph_research_builder = StateGraph(GraphResearchState, input=ReportStateInput, output=ReportStateOutput, config_schema=Configuration)
@@ -1,11 +1,8 @@
 import asyncio
-import queue
-import random
-import uuid
+import hashlib
+import re
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
-from copy import deepcopy
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 from langchain.chat_models import init_chat_model
 from langchain_core.messages import HumanMessage, SystemMessage
@@ -15,6 +12,226 @@ from open_deep_research.configuration import Configuration
 from open_deep_research.utils import get_config_value, get_search_params, select_and_execute_search
 
 
+# A generated sub-question: any line containing a question mark, with leading
+# numbering or bullets and surrounding bold or italic markers removed
+_QUESTION_RE = re.compile(
+    r'^[ \t]*(?:\*\*|__)?[ \t]*(?:\d+[.)]|[-\u2022]|\*(?=[ \t]))?[ \t]*'
+    r'(?:\*\*|__|\*|_)?(.*?\?.*?)(?:\*\*|__|\*|_)?[ \t]*$',
+    re.MULTILINE,
+)
+
+
+def _parse_questions(content: str) -> List[str]:
+    """Extract the sub-questions from a model response.
+    
+    Args:
+        content (str): Text of the model response
+        
+    Returns:
+        List[str]: Questions in the order they appear, without list markers or emphasis
+    """
+    questions = []
+    for match in _QUESTION_RE.findall(content):
+        question = match.replace("**", "").replace("__", "").strip()
+        if question:
+            questions.append(question)
+    return questions
+
+
+# Chat models shared across agents, keyed by provider, model and model kwargs
+_CHAT_MODELS: Dict[Tuple[str, str, str], Any] = {}
+
+
+def _get_chat_model(provider: str, model: str, model_kwargs: Dict[str, Any]):
+    """Get a chat model, reusing a previously initialized one for the same settings.
+    
+    Reusing the model also reuses its client and HTTP connection pool across
+    research runs.
+    
+    Args:
+        provider (str): The model provider
+        model (str): The model name
+        model_kwargs (Dict[str, Any]): Additional model kwargs
+        
+    Returns:
+        The initialized chat model
+    """
+    # kwargs values may be unhashable, so key on their repr
+    key = (provider, model, repr(sorted(model_kwargs.items())))
+    if key not in _CHAT_MODELS:
+        _CHAT_MODELS[key] = init_chat_model(
+            model=model, 
+            model_provider=provider, 
+            model_kwargs=model_kwargs
+        )
+    return _CHAT_MODELS[key]
+
+
+# Completed LLM responses, keyed by a hash of the model settings and the prompt.
+# Oldest entries are evicted once the cache is full.
+_RESPONSE_CACHE: Dict[str, str] = {}
+_RESPONSE_CACHE_SIZE = 128
+
+# Number of streamed chunks between partial response updates
+_PARTIAL_EVERY_CHUNKS = 16
+
+
+def _chunk_text(chunk) -> str:
+    """Get the text of a streamed message chunk, whether its content is a string or blocks."""
+    if isinstance(chunk.content, str):
+        return chunk.content
+    return "".join(block.get("text", "") for block in chunk.content if isinstance(block, dict))
+
+
+def _response_cache_key(model_key: Tuple[str, str, str], messages: List[Any]) -> str:
+    """Get the response cache key for a model call.
+    
+    Args:
+        model_key (Tuple[str, str, str]): Provider, model name and model kwargs repr
+        messages (List[Any]): Messages sent to the model
+        
+    Returns:
+        str: Hash of the model settings and every message
+    """
+    digest = hashlib.sha256(repr((model_key, [(m.type, m.content) for m in messages])).encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def _cached_ainvoke(
+    model,
+    model_key: Tuple[str, str, str],
+    messages: List[Any],
+    on_partial: Optional[Callable[[str], None]] = None,
+    use_cache: bool = True,
+) -> str:
+    """Invoke a chat model, reusing the response for an identical earlier prompt.
+    
+    Rerunning with the same topic or the same search results otherwise repays
+    the full LLM call. The key covers the model settings and every message, so any
+    change to the prompt text invalidates it.
+    
+    Args:
+        model: The chat model to invoke
+        model_key (Tuple[str, str, str]): Provider, model name and model kwargs repr
+        messages (List[Any]): Messages to send to the model
+        on_partial (Callable[[str], None], optional): If given, the response is
+            streamed and this is called every few chunks with the text generated
+            since the previous call, so the calls add up to the whole response.
+            A cached response is passed in a single call. Defaults to None.
+        use_cache (bool, optional): Whether an earlier response may be reused. When
+            False the model is always called, e.g. to regenerate a rejected output,
+            and the new response replaces the cached one. Defaults to True.
+        
+    Returns:
+        str: The response content
+    """
+    key = _response_cache_key(model_key, messages)
+    if use_cache and key in _RESPONSE_CACHE:
+        content = _RESPONSE_CACHE[key]
+        if on_partial is not None:
+            on_partial(content)
+        return content
+    
+    if on_partial is None:
+        content = (await model.ainvoke(messages)).content
+    else:
+        parts = []
+        published = 0
+        async for chunk in model.astream(messages):
+            parts.append(_chunk_text(chunk))
+            if len(parts) - published == _PARTIAL_EVERY_CHUNKS:
+                on_partial("".join(parts[published:]))
+                published = len(parts)
+        if published < len(parts):
+            on_partial("".join(parts[published:]))
+        content = "".join(parts)
+    
+    _RESPONSE_CACHE.pop(key, None)
+    if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_SIZE:
+        del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+    _RESPONSE_CACHE[key] = content
+    return content
+
+
+# Start of one source in formatted search results: the section separator used by
+# deduplicate_and_format_sources, or the per-source header of the scraping search APIs
+_SOURCE_START_RE = re.compile(r'(?=={80}\nSource: |\n\n--- SOURCE \d+: )')
+
+_TRUNCATION_MARKER = "\n...[truncated]\n"
+
+
+def _truncate_result(source_str: str, max_chars: int) -> str:
+    """Cap search results to a maximum size, sharing it evenly between sources.
+    
+    Each source keeps its beginning, where its title, URL and summary are, so a
+    long source cannot push the others out of the results.
+    
+    Args:
+        source_str (str): Formatted search results
+        max_chars (int): Maximum number of characters to keep
+        
+    Returns:
+        str: The search results, shortened if they were longer than max_chars
+    """
+    if len(source_str) <= max_chars:
+        return source_str
+    if max_chars <= len(_TRUNCATION_MARKER):
+        return source_str[:max(max_chars, 0)]
+    preamble, *sources = _SOURCE_START_RE.split(source_str)
+    budget = max_chars - len(preamble)
+    if not sources or budget < len(sources) * len(_TRUNCATION_MARKER):
+        return source_str[:max_chars - len(_TRUNCATION_MARKER)] + _TRUNCATION_MARKER
+    per_source = budget // len(sources)
+    return preamble + "".join(
+        source if len(source) <= per_source
+        else source[:per_source - len(_TRUNCATION_MARKER)] + _TRUNCATION_MARKER
+        for source in sources
+    )
+
+
+def _with_feedback(request: str, feedback: Optional[str]) -> str:
+    """Append reviewer feedback, if any, to a request for the model.
+    
+    Blank feedback adds nothing to the request. The graph workflow never passes it,
+    since it turns a rejection without a comment into an instruction to produce a
+    different version.
+    
+    Args:
+        request (str): The request to the model
+        feedback (str, optional): Feedback on the previous output
+        
+    Returns:
+        str: The request, followed by the feedback if there is any
+    """
+    feedback = (feedback or "").strip()
+    if not feedback:
+        return request
+    return f"{request}\n\nTake this feedback on the previous version into account:\n{feedback}"
+
+
+def _cacheable_system_content(provider: str, instructions: str, context: str):
+    """Build system message content with the static instructions before the large context.
+    
+    The instructions and context are kept in a fixed order so repeated calls share a
+    byte-identical prefix that providers can cache. For Anthropic the context block is
+    additionally marked with ``cache_control`` so it is cached explicitly.
+    
+    Args:
+        provider (str): The model provider
+        instructions (str): Static instructions for the model
+        context (str): Large context block, e.g. the combined search results
+        
+    Returns:
+        The message content, either a string or a list of content blocks
+    """
+    if provider == "anthropic":
+        return [
+            {"type": "text", "text": instructions},
+            {"type": "text", "text": context, "cache_control": {"type": "ephemeral"}},
+        ]
+    return instructions + context
+
+
 class ResearchGraph:
     """A graph-based structure for managing research nodes and their relationships.
     
@@ -25,19 +242,18 @@ class ResearchGraph:
     Attributes:
         nodes (Dict[str, Dict[str, Any]]): Dictionary of nodes in the graph
         adjacency_list (Dict[str, List[dict]]): Adjacency list representing edges
-        future_to_query (Dict): Mapping of futures to queries for async execution
-        executor (ThreadPoolExecutor): Executor for parallel processing
-        n_active_tasks (int): Number of active search tasks
+        search_results_queue (asyncio.Queue): Queue of node and edge updates for streaming
     """
     
     def __init__(self):
         """Initialize a new ResearchGraph."""
         self.nodes: Dict[str, Dict[str, Any]] = {}
         self.adjacency_list: Dict[str, List[dict]] = defaultdict(list)
-        self.future_to_query = dict()
-        self.executor = ThreadPoolExecutor(max_workers=10)
-        self.n_active_tasks = 0
-        self.search_results_queue = queue.Queue()
+        self._search_node_names: List[str] = []
+        self._search_results_parts: Dict[str, str] = {}
+        self._search_results_text: Optional[str] = None
+        self._edge_seq = 0
+        self.search_results_queue: asyncio.Queue = asyncio.Queue()
     
     def add_root_node(
         self,
@@ -57,21 +273,38 @@ class ResearchGraph:
         self,
         node_name: str,
         node_content: str,
-        config: RunnableConfig,
+        config: Optional[RunnableConfig] = None,
         parent_node: Optional[str] = "root",
+        search_api: Optional[str] = None,
+        params_to_pass: Optional[Dict[str, Any]] = None,
+        max_chars: Optional[int] = None,
     ):
         """Add a search node for a specific research question.
         
+        Callers adding many nodes can resolve the search settings once and pass
+        search_api and params_to_pass instead of a config.
+        
         Args:
             node_name (str): Name for the node
             node_content (str): The research question
-            config (RunnableConfig): Configuration for search
+            config (RunnableConfig, optional): Configuration for search, used when
+                search_api is not given, and for the cap on the results when max_chars is
+                not given. Defaults to None.
             parent_node (str, optional): Parent node name. Defaults to "root".
+            search_api (str, optional): Name of the search API to use. Defaults to None.
+            params_to_pass (Dict[str, Any], optional): Parameters to pass to the search API. Defaults to None.
+            max_chars (int, optional): Maximum characters of search results to keep, shared
+                between the sources. Defaults to None, which uses max_chars_per_result from
+                config; with no config the results are not capped.
             
         Returns:
             Dict: The search results
         """
         # Create the node
+        if self.nodes.get(node_name, {}).get("type") != "search":
+            self._search_node_names.append(node_name)
+        self._search_results_parts.pop(node_name, None)
+        self._search_results_text = None
         self.nodes[node_name] = dict(content=node_content, type="search")
         self.adjacency_list[node_name] = []
         
@@ -80,20 +313,29 @@ class ResearchGraph:
             self.add_edge(parent_node, node_name)
         
         # Get configuration
-        configurable = Configuration.from_runnable_config(config)
-        search_api = get_config_value(configurable.search_api)
-        search_api_config = configurable.search_api_config or {}
-        params_to_pass = get_search_params(search_api, search_api_config)
+        if search_api is None:
+            configurable = Configuration.from_runnable_config(config)
+            search_api = get_config_value(configurable.search_api)
+            search_api_config = configurable.search_api_config or {}
+            params_to_pass = get_search_params(search_api, search_api_config)
+            if max_chars is None:
+                max_chars = configurable.max_chars_per_result
+        elif max_chars is None and config is not None:
+            max_chars = Configuration.from_runnable_config(config).max_chars_per_result
         
         # Execute search
         query_list = [node_content]
-        source_str = await select_and_execute_search(search_api, query_list, params_to_pass)
+        source_str = await select_and_execute_search(search_api, query_list, params_to_pass or {})
+        if max_chars is not None:
+            source_str = _truncate_result(source_str, max_chars)
         
         # Store results in the node
         self.nodes[node_name]["response"] = source_str
+        self._search_results_parts[node_name] = f"## {node_content}\n\n{source_str}"
+        self._search_results_text = None
         
         # Put results in queue for streaming
-        self.search_results_queue.put((node_name, self.nodes[node_name], []))
+        self.search_results_queue.put_nowait((node_name, self.nodes[node_name], []))
         
         return source_str
     
@@ -113,14 +355,30 @@ class ResearchGraph:
         self.nodes[node_name] = dict(content=node_content, type="response")
         self.adjacency_list[node_name] = []
         
-        # Connect to parent nodes if provided
+        # Connect to parent nodes if provided, emitting each parent's edges once
         if parent_nodes:
-            for parent in parent_nodes:
-                if parent in self.nodes:
-                    self.add_edge(parent, node_name)
+            parents = [parent for parent in dict.fromkeys(parent_nodes) if parent in self.nodes]
+            for parent in parents:
+                self._add_edge_no_emit(parent, node_name)
+            for parent in parents:
+                self.search_results_queue.put_nowait(
+                    (parent, self.nodes[parent], self.adjacency_list[parent])
+                )
         
         # Put in queue for streaming
-        self.search_results_queue.put((node_name, self.nodes[node_name], []))
+        self.search_results_queue.put_nowait((node_name, self.nodes[node_name], []))
+    
+    def _add_edge_no_emit(self, start_node: str, end_node: str):
+        """Add an edge between two nodes without streaming the update.
+        
+        Args:
+            start_node (str): Starting node name
+            end_node (str): Ending node name
+        """
+        # Edge ids only need to be unique within this graph
+        self._edge_seq += 1
+        edge_id = f"e{self._edge_seq}"
+        self.adjacency_list[start_node].append(dict(id=edge_id, name=end_node, state=2))
     
     def add_edge(self, start_node: str, end_node: str):
         """Add an edge between two nodes.
@@ -129,9 +387,8 @@ class ResearchGraph:
             start_node (str): Starting node name
             end_node (str): Ending node name
         """
-        edge_id = str(uuid.uuid4())
-        self.adjacency_list[start_node].append(dict(id=edge_id, name=end_node, state=2))
-        self.search_results_queue.put(
+        self._add_edge_no_emit(start_node, end_node)
+        self.search_results_queue.put_nowait(
             (start_node, self.nodes[start_node], self.adjacency_list[start_node])
         )
     
@@ -139,6 +396,9 @@ class ResearchGraph:
         """Reset the graph, clearing all nodes and edges."""
         self.nodes = {}
         self.adjacency_list = defaultdict(list)
+        self._search_node_names = []
+        self._search_results_parts = {}
+        self._search_results_text = None
     
     def node(self, node_name: str) -> dict:
         """Get a copy of a node's data.
@@ -151,18 +411,29 @@ class ResearchGraph:
         """
         return self.nodes[node_name].copy() if node_name in self.nodes else {}
     
+    def search_node_names(self) -> List[str]:
+        """Get the names of the search nodes.
+        
+        Returns:
+            List[str]: Search node names in the order the nodes were added
+        """
+        return list(self._search_node_names)
+    
     def get_all_search_results(self) -> str:
         """Get all search results from the graph.
         
         Returns:
             str: Combined search results from all search nodes
         """
-        results = []
-        for name, node in self.nodes.items():
-            if node["type"] == "search" and "response" in node:
-                results.append(f"## {node['content']}\n\n{node['response']}")
-        
-        return "\n\n".join(results)
+        # Parts are formatted as results arrive; join them in node order once and
+        # reuse the text until another result is attached
+        if self._search_results_text is None:
+            self._search_results_text = "\n\n".join(
+                self._search_results_parts[name]
+                for name in self._search_node_names
+                if name in self._search_results_parts
+            )
+        return self._search_results_text
     
     def to_visualization_data(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
         """Convert the graph to a format suitable for visualization.
@@ -170,9 +441,10 @@ class ResearchGraph:
         Returns:
             Tuple: (nodes, edges) in a format suitable for visualization libraries
         """
-        # Create a deep copy to avoid modifying the original data
-        nodes = deepcopy(self.nodes)
-        edges = deepcopy(self.adjacency_list)
+        # Copy the containers to avoid modifying the original data; the string
+        # values are immutable and can be shared
+        nodes = {name: dict(node) for name, node in self.nodes.items()}
+        edges = {name: [dict(edge) for edge in neighbors] for name, neighbors in self.adjacency_list.items()}
         
         # Update edge states based on node completion
         for neighbors in edges.values():
@@ -206,6 +478,78 @@ class GraphResearchAgent:
         self.graph = ResearchGraph()
         self.config = config
         self.configurable = Configuration.from_runnable_config(config)
+        
+        # Resolve the writer model settings once for all LLM steps
+        self._writer_provider = get_config_value(self.configurable.writer_provider)
+        self._writer_model_name = get_config_value(self.configurable.writer_model)
+        self._writer_model_kwargs = get_config_value(self.configurable.writer_model_kwargs or {})
+        self._writer_model = None
+        
+        # Feedback and response cache key each LLM step was last called with, to tell
+        # a repeated submission from new feedback and to drop rejected responses
+        self._last_feedback: Dict[str, Optional[str]] = {}
+        self._last_cache_key: Dict[str, str] = {}
+    
+    def _get_writer_model(self):
+        """Get the writer model, initializing it on first use.
+        
+        The model is kept on the agent so every LLM step of a research run reuses
+        the same client (and its HTTP connection pool), and is shared with other
+        agents using the same model settings.
+        
+        Returns:
+            The initialized writer chat model
+        """
+        if self._writer_model is None:
+            self._writer_model = _get_chat_model(
+                self._writer_provider, self._writer_model_name, self._writer_model_kwargs
+            )
+        return self._writer_model
+    
+    async def _ainvoke_writer(
+        self,
+        step: str,
+        messages: List[Any],
+        feedback: Optional[str],
+        use_cache: Optional[bool],
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> str:
+        """Call the writer model for an LLM step through the response cache.
+        
+        When the step is regenerated, the response of its previous call was rejected,
+        so it is dropped from the cache; otherwise a later run with the same prompt
+        would return it again.
+        
+        Args:
+            step (str): Name of the LLM step
+            messages (List[Any]): Messages to send to the model
+            feedback (str, optional): Feedback the step is called with
+            use_cache (bool, optional): Whether a cached response may be reused, or None to
+                reuse one only when the feedback is the same as on the previous call of the step
+            on_partial (Callable[[str], None], optional): Called with each new piece of the
+                response as it is generated. Defaults to None.
+            
+        Returns:
+            str: The response content
+        """
+        if use_cache is None:
+            use_cache = feedback == self._last_feedback.get(step)
+        if not use_cache and step in self._last_cache_key:
+            _RESPONSE_CACHE.pop(self._last_cache_key[step], None)
+        self._last_feedback[step] = feedback
+        self._last_cache_key[step] = _response_cache_key(self._writer_model_key(), messages)
+        return await _cached_ainvoke(
+            self._get_writer_model(), self._writer_model_key(), messages,
+            on_partial=on_partial, use_cache=use_cache,
+        )
+    
+    def _writer_model_key(self) -> Tuple[str, str, str]:
+        """Get the key identifying the writer model settings for response caching."""
+        return (
+            self._writer_provider,
+            self._writer_model_name,
+            repr(sorted(self._writer_model_kwargs.items())),
+        )
     
     async def initialize_with_topic(self, topic: str):
         """Initialize the research graph with a main topic.
@@ -215,28 +559,27 @@ class GraphResearchAgent:
         """
         self.graph.add_root_node(node_content=topic)
     
-    async def generate_sub_questions(self, topic: str, num_questions: int = 3) -> List[str]:
+    async def generate_sub_questions(
+        self,
+        topic: str,
+        num_questions: int = 3,
+        feedback: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+    ) -> List[str]:
         """Generate sub-questions for a research topic.
         
         Args:
             topic (str): The research topic
             num_questions (int, optional): Number of questions to generate. Defaults to 3.
+            feedback (str, optional): Feedback on previously generated questions. Defaults to None.
+            use_cache (bool, optional): Whether a cached response for the same prompt may be
+                reused. Pass False to regenerate. Defaults to None, which reuses one only
+                when the feedback is unchanged since the previous call, so submitting the
+                same feedback twice does not call the model again.
             
         Returns:
             List[str]: List of generated sub-questions
         """
-        # Get configuration
-        writer_provider = get_config_value(self.configurable.writer_provider)
-        writer_model_name = get_config_value(self.configurable.writer_model)
-        writer_model_kwargs = get_config_value(self.configurable.writer_model_kwargs or {})
-        
-        # Initialize the model
-        writer_model = init_chat_model(
-            model=writer_model_name, 
-            model_provider=writer_provider, 
-            model_kwargs=writer_model_kwargs
-        )
-        
         # Create prompt for generating sub-questions
         system_prompt = f"""
         You are a research assistant tasked with breaking down a complex topic into specific sub-questions.
@@ -252,25 +595,15 @@ class GraphResearchAgent:
         """
         
         # Generate sub-questions
-        response = await writer_model.ainvoke([
+        content = await self._ainvoke_writer("sub_questions", [
             SystemMessage(content=system_prompt),
-            HumanMessage(content=f"Generate {num_questions} sub-questions for researching: {topic}")
-        ])
-        
-        # Parse the response to extract questions
-        content = response.content
-        questions = []
-        
-        # Simple parsing - extract lines that end with question marks
-        for line in content.split('\n'):
-            line = line.strip()
-            if line and '?' in line:
-                # Remove any numbering or bullets
-                cleaned_line = line.lstrip('0123456789.- ')
-                questions.append(cleaned_line)
+            HumanMessage(content=_with_feedback(
+                f"Generate {num_questions} sub-questions for researching: {topic}", feedback
+            ))
+        ], feedback, use_cache)
         
-        # Ensure we have the requested number of questions
-        return questions[:num_questions]
+        # Parse the response to extract questions, keeping the requested number
+        return _parse_questions(content)[:num_questions]
     
     async def expand_graph_with_questions(self, questions: List[str]):
         """Expand the research graph with new questions.
@@ -278,37 +611,59 @@ class GraphResearchAgent:
         Args:
             questions (List[str]): List of questions to add to the graph
         """
-        for i, question in enumerate(questions):
-            node_name = f"question_{i+1}"
-            await self.graph.add_search_node(
-                node_name=node_name,
-                node_content=question,
-                config=self.config
-            )
+        # Search each distinct question only once; the planner can repeat itself
+        unique_questions = {}
+        for question in questions:
+            unique_questions.setdefault(" ".join(question.lower().split()), question)
+        
+        # Resolve the search settings once for the whole batch
+        search_api = get_config_value(self.configurable.search_api)
+        search_api_config = self.configurable.search_api_config or {}
+        params_to_pass = get_search_params(search_api, search_api_config)
+        
+        # The searches are independent, so run them concurrently, bounded to
+        # avoid overloading the search provider
+        semaphore = asyncio.Semaphore(self.configurable.max_concurrent_searches)
+        
+        async def search(node_name: str, question: str):
+            async with semaphore:
+                await self.graph.add_search_node(
+                    node_name=node_name,
+                    node_content=question,
+                    search_api=search_api,
+                    params_to_pass=params_to_pass,
+                    max_chars=self.configurable.max_chars_per_result,
+                )
+        
+        await asyncio.gather(*(
+            search(f"question_{i+1}", question)
+            for i, question in enumerate(unique_questions.values())
+        ))
     
-    async def generate_final_response(self) -> str:
+    async def generate_final_response(
+        self,
+        feedback: Optional[str] = None,
+        use_cache: Optional[bool] = None,
+        on_partial: Optional[Callable[[str], None]] = None,
+    ) -> str:
         """Generate a final response based on all search results.
         
+        Args:
+            feedback (str, optional): Feedback on a previously generated report. Defaults to None.
+            use_cache (bool, optional): Whether a cached response for the same prompt may be
+                reused. Pass False to regenerate. Defaults to None, which reuses one only
+                when the feedback is unchanged since the previous call.
+            on_partial (Callable[[str], None], optional): Called with each new piece of the
+                report as it is written. Defaults to None.
+        
         Returns:
             str: The final research response
         """
         # Get all search results
         all_results = self.graph.get_all_search_results()
         
-        # Get configuration
-        writer_provider = get_config_value(self.configurable.writer_provider)
-        writer_model_name = get_config_value(self.configurable.writer_model)
-        writer_model_kwargs = get_config_value(self.configurable.writer_model_kwargs or {})
-        
-        # Initialize the model
-        writer_model = init_chat_model(
-            model=writer_model_name, 
-            model_provider=writer_provider, 
-            model_kwargs=writer_model_kwargs
-        )
-        
         # Create prompt for generating the final response
-        system_prompt = f"""
+        system_prompt = """
         You are a research assistant tasked with synthesizing search results into a comprehensive report.
         Based on the search results provided, create a well-structured report that addresses the main topic.
         
@@ -318,25 +673,37 @@ class GraphResearchAgent:
         3. Synthesize information from multiple sources
         4. Include a conclusion that summarizes key findings
         5. Use markdown formatting for better readability
-        
+        """
+        results_prompt = f"""
         The search results are provided in the following format:
         
         {all_results}
         """
         
-        # Generate the final response
-        response = await writer_model.ainvoke([
-            SystemMessage(content=system_prompt),
-            HumanMessage(content="Generate a comprehensive report based on the search results.")
-        ])
+        # Stream the final response, publishing each new piece of the report as it
+        # is written
+        def publish_partial(text: str):
+            self.graph.search_results_queue.put_nowait(
+                ("response_partial", dict(content=text, type="response_partial"), [])
+            )
+            if on_partial is not None:
+                on_partial(text)
+        
+        report = await self._ainvoke_writer("final_response", [
+            SystemMessage(content=_cacheable_system_content(self._writer_provider, system_prompt, results_prompt)),
+            HumanMessage(content=_with_feedback(
+                "Generate a comprehensive report based on the search results.", feedback
+            ))
+        ], feedback, use_cache, on_partial=publish_partial)
         
         # Add the response to the graph
         self.graph.add_response_node(
-            node_content=response.content,
-            parent_nodes=[node for node in self.graph.nodes if self.graph.nodes[node]["type"] == "search"]
+            node_content=report,
+            parent_nodes=self.graph.search_node_names()
         )
         
-        return response.content
+        return report
+    
     
     def get_visualization_data(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, List[Dict[str, Any]]]]:
         """Get data for visualizing the research graph.
@@ -1,90 +1,44 @@
+import gzip
 import json
 import os
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, Iterator, Optional
 
-def generate_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any], title: str = "Research Graph") -> str:
-    """Generate an HTML visualization of the research graph.
-    
-    Args:
-        nodes (Dict[str, Dict[str, Any]]): Dictionary of graph nodes
-        edges (Dict[str, Any]): Dictionary of graph edges
-        title (str, optional): Title for the visualization. Defaults to "Research Graph".
-        
-    Returns:
-        str: HTML content for visualizing the graph
-    """
-    # Convert nodes and edges to the format expected by D3.js
-    nodes_list = []
-    for node_id, node_data in nodes.items():
-        node_type = node_data.get("type", "unknown")
-        node_obj = {
-            "id": node_id,
-            "label": node_data.get("content", "")[:50] + ("..." if len(node_data.get("content", "")) > 50 else ""),
-            "type": node_type,
-            "data": node_data
-        }
-        nodes_list.append(node_obj)
-    
-    links_list = []
-    for source, targets in edges.items():
-        for target in targets:
-            links_list.append({
-                "source": source,
-                "target": target["name"],
-                "id": target["id"],
-                "state": target["state"]
-            })
-    
-    # Create the HTML content with embedded D3.js visualization
-    html_content = f"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Static HTML page for the graph visualization. The title, the D3 script tag and the
+# JSON graph data are spliced in at the __TITLE__, __D3__, __NODES__ and __LINKS__ markers.
+_HTML_TEMPLATE = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
-        <title>{title}</title>
-        <script src="https://d3js.org/d3.v7.min.js"></script>
+        <title>__TITLE__</title>
+        __D3__
         <style>
-            body {{
+            body {
                 font-family: Arial, sans-serif;
                 margin: 0;
                 padding: 0;
                 background-color: #f5f5f5;
-            }}
-            #graph-container {{
+            }
+            #graph-container {
                 width: 100%;
                 height: 800px;
                 background-color: white;
                 border: 1px solid #ddd;
                 border-radius: 5px;
                 overflow: hidden;
-            }}
-            .node {{
-                cursor: pointer;
-            }}
-            .node circle {{
-                stroke-width: 2px;
-            }}
-            .node text {{
-                font-size: 12px;
-                fill: #333;
-            }}
-            .link {{
-                stroke-width: 2px;
-                stroke-opacity: 0.6;
-            }}
-            .node-root circle {{
-                fill: #ff7f0e;
-                stroke: #e67300;
-            }}
-            .node-search circle {{
-                fill: #1f77b4;
-                stroke: #0e5a8a;
-            }}
-            .node-response circle {{
-                fill: #2ca02c;
-                stroke: #1a7a1a;
-            }}
-            .tooltip {{
+            }
+            .tooltip {
                 position: absolute;
                 background-color: rgba(255, 255, 255, 0.9);
                 border: 1px solid #ddd;
@@ -94,13 +48,13 @@ def generate_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any],
                 font-size: 12px;
                 pointer-events: none;
                 z-index: 10;
-            }}
-            .controls {{
+            }
+            .controls {
                 padding: 10px;
                 background-color: #f0f0f0;
                 border-bottom: 1px solid #ddd;
-            }}
-            button {{
+            }
+            button {
                 margin-right: 5px;
                 padding: 5px 10px;
                 background-color: #4CAF50;
@@ -108,20 +62,10 @@ def generate_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any],
                 border: none;
                 border-radius: 3px;
                 cursor: pointer;
-            }}
-            button:hover {{
+            }
+            button:hover {
                 background-color: #45a049;
-            }}
-            .state-1 {{
-                stroke: #ff7f0e;
-                stroke-dasharray: 5;
-            }}
-            .state-2 {{
-                stroke: #aaa;
-            }}
-            .state-3 {{
-                stroke: #2ca02c;
-            }}
+            }
         </style>
     </head>
     <body>
@@ -129,90 +73,221 @@ def generate_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any],
             <button id="zoom-in">Zoom In</button>
             <button id="zoom-out">Zoom Out</button>
             <button id="reset">Reset</button>
+            <button id="pause">Resume</button>
         </div>
         <div id="graph-container"></div>
         <div id="tooltip" class="tooltip" style="display: none;"></div>
         
         <script>
-            // Graph data
+            // Graph data, shipped as parallel columns and expanded into the
+            // node and link objects d3 works on. Links refer to nodes by index.
+            const nodeColumns = __NODES__;
+            const linkColumns = __LINKS__;
             const graphData = {
-                nodes: ${json.dumps(nodes_list)},
-                links: ${json.dumps(links_list)}
+                nodes: nodeColumns.ids.map((id, i) => ({
+                    id: id,
+                    type: nodeColumns.types[i],
+                    content: nodeColumns.contents[i],
+                    response: nodeColumns.responses[i]
+                })),
+                links: linkColumns.source.map((source, i) => ({
+                    source: source,
+                    target: linkColumns.target[i],
+                    state: linkColumns.state[i]
+                }))
+            };
+            
+            // Node and link styles, drawn directly onto the canvas
+            const NODE_STYLES = {
+                root: {fill: '#ff7f0e', stroke: '#e67300', radius: 20},
+                search: {fill: '#1f77b4', stroke: '#0e5a8a', radius: 12},
+                response: {fill: '#2ca02c', stroke: '#1a7a1a', radius: 15}
             };
+            const DEFAULT_NODE_STYLE = {fill: '#999', stroke: '#666', radius: 12};
+            const MAX_NODE_RADIUS = 20;
             
-            // Set up the SVG container
-            const width = document.getElementById('graph-container').clientWidth;
-            const height = document.getElementById('graph-container').clientHeight;
+            // state: 1=in progress, 2=not started, 3=completed
+            const LINK_STYLES = {
+                1: {stroke: '#ff7f0e', dash: [5, 5]},
+                2: {stroke: '#aaa', dash: []},
+                3: {stroke: '#2ca02c', dash: []}
+            };
             
-            const svg = d3.select('#graph-container')
-                .append('svg')
-                .attr('width', width)
-                .attr('height', height);
+            graphData.nodes.forEach(d => {
+                d.style = NODE_STYLES[d.type] || DEFAULT_NODE_STYLE;
+            });
             
-            // Create a group for the graph
-            const g = svg.append('g');
+            // Group the links by state so each style is set once per draw
+            const linksByState = d3.group(graphData.links, d => d.state in LINK_STYLES ? d.state : 2);
             
-            // Set up zoom behavior
-            const zoom = d3.zoom()
-                .scaleExtent([0.1, 4])
-                .on('zoom', (event) => {
-                    g.attr('transform', event.transform);
-                });
+            // Set up the canvas, scaled for high-DPI displays
+            const container = document.getElementById('graph-container');
+            const width = container.clientWidth;
+            const height = container.clientHeight;
+            const dpr = window.devicePixelRatio || 1;
             
-            svg.call(zoom);
+            const canvas = d3.select(container)
+                .append('canvas')
+                .attr('width', width * dpr)
+                .attr('height', height * dpr)
+                .style('width', `${width}px`)
+                .style('height', `${height}px`);
+            
+            const context = canvas.node().getContext('2d');
+            
+            // Fit each label to a maximum width once, measured in the canvas font
+            const LABEL_FONT = '12px Arial';
+            const MAX_LABEL_WIDTH = 250;
+            
+            function fitLabel(text) {
+                if (context.measureText(text).width <= MAX_LABEL_WIDTH) {
+                    return text;
+                }
+                let lo = 0;
+                let hi = text.length;
+                while (lo < hi) {
+                    const mid = (lo + hi + 1) >> 1;
+                    if (context.measureText(text.slice(0, mid) + '...').width <= MAX_LABEL_WIDTH) {
+                        lo = mid;
+                    } else {
+                        hi = mid - 1;
+                    }
+                }
+                return text.slice(0, lo) + '...';
+            }
+            
+            context.font = LABEL_FONT;
+            graphData.nodes.forEach(d => {
+                d.label = fitLabel(d.content);
+            });
+            
+            // Current zoom transform, applied when drawing
+            let transform = d3.zoomIdentity;
+            
+            // Whether the user has paused the simulation, and whether it is running;
+            // the pause button offers whichever action applies to the current state
+            let paused = false;
+            let running = false;
+            const pauseButton = document.getElementById('pause');
+            
+            function setRunning(value) {
+                running = value;
+                pauseButton.textContent = running ? 'Pause' : 'Resume';
+            }
             
             // Set up the simulation
             const simulation = d3.forceSimulation(graphData.nodes)
-                .force('link', d3.forceLink(graphData.links).id(d => d.id).distance(150))
+                .force('link', d3.forceLink(graphData.links).distance(150))
                 .force('charge', d3.forceManyBody().strength(-500))
-                .force('center', d3.forceCenter(width / 2, height / 2))
-                .force('collision', d3.forceCollide().radius(80));
-            
-            // Create the links
-            const link = g.append('g')
-                .selectAll('line')
-                .data(graphData.links)
-                .enter()
-                .append('line')
-                .attr('class', d => `link state-\${d.state}`)
-                .attr('stroke-width', 2);
-            
-            // Create the nodes
-            const node = g.append('g')
-                .selectAll('.node')
-                .data(graphData.nodes)
-                .enter()
-                .append('g')
-                .attr('class', d => `node node-\${d.type}`)
-                .call(d3.drag()
-                    .on('start', dragstarted)
-                    .on('drag', dragged)
-                    .on('end', dragended));
-            
-            // Add circles to the nodes
-            node.append('circle')
-                .attr('r', d => d.type === 'root' ? 20 : (d.type === 'response' ? 15 : 12))
-                .on('mouseover', showTooltip)
-                .on('mouseout', hideTooltip);
-            
-            // Add labels to the nodes
-            node.append('text')
-                .attr('dx', 15)
-                .attr('dy', 4)
-                .text(d => d.label);
+                .force('center', d3.forceCenter(width / 2, height / 2));
+            
+            // Small graphs spread out without collision handling; for larger ones
+            // the collision radius shrinks as the graph grows
+            if (graphData.nodes.length >= 20) {
+                const collideRadius = Math.min(80, Math.max(12, 80 / Math.sqrt(graphData.nodes.length / 50)));
+                simulation.force('collision', d3.forceCollide(collideRadius).strength(0.7));
+            }
+            
+            // Run the layout to completion up front instead of animating every tick
+            simulation.stop();
+            simulation.tick(Math.ceil(Math.log(simulation.alphaMin()) / Math.log(1 - simulation.alphaDecay())));
+            
+            // Redraw the whole graph
+            function draw() {
+                context.setTransform(dpr, 0, 0, dpr, 0, 0);
+                context.clearRect(0, 0, width, height);
+                context.translate(transform.x, transform.y);
+                context.scale(transform.k, transform.k);
+                
+                // Draw the links
+                context.lineWidth = 2;
+                context.globalAlpha = 0.6;
+                for (const [state, links] of linksByState) {
+                    const style = LINK_STYLES[state];
+                    context.strokeStyle = style.stroke;
+                    context.setLineDash(style.dash);
+                    context.beginPath();
+                    for (const d of links) {
+                        context.moveTo(d.source.x, d.source.y);
+                        context.lineTo(d.target.x, d.target.y);
+                    }
+                    context.stroke();
+                }
+                context.setLineDash([]);
+                context.globalAlpha = 1;
+                
+                // Draw the nodes
+                for (const d of graphData.nodes) {
+                    context.beginPath();
+                    context.arc(d.x, d.y, d.style.radius, 0, 2 * Math.PI);
+                    context.fillStyle = d.style.fill;
+                    context.fill();
+                    context.strokeStyle = d.style.stroke;
+                    context.stroke();
+                }
+                
+                // Draw the labels
+                context.font = LABEL_FONT;
+                context.fillStyle = '#333';
+                for (const d of graphData.nodes) {
+                    context.fillText(d.label, d.x + 15, d.y + 4);
+                }
+            }
+            
+            // Redraw at most once per animation frame, however many ticks, zoom or
+            // drag events arrive in between
+            let drawPending = false;
+            
+            function scheduleDraw() {
+                if (drawPending) {
+                    return;
+                }
+                drawPending = true;
+                window.requestAnimationFrame(() => {
+                    drawPending = false;
+                    draw();
+                });
+            }
+            
+            // Spatial index of node positions for hit-testing, rebuilt lazily on the
+            // first lookup after the nodes have moved
+            let nodeIndex = null;
+            
+            // Find the node under a point in graph coordinates
+            function findNode(x, y) {
+                if (nodeIndex === null) {
+                    nodeIndex = d3.quadtree(graphData.nodes, d => d.x, d => d.y);
+                }
+                const d = nodeIndex.find(x, y, MAX_NODE_RADIUS);
+                if (d && Math.hypot(d.x - x, d.y - y) <= d.style.radius) {
+                    return d;
+                }
+                return undefined;
+            }
+            
+            // Update positions on each tick of the simulation
+            simulation.on('tick', () => {
+                nodeIndex = null;
+                scheduleDraw();
+            });
+            
+            // The simulation stops by itself once it settles
+            simulation.on('end', () => setRunning(false));
+            
+            draw();
             
             // Set up the tooltip
             const tooltip = d3.select('#tooltip');
             
             function showTooltip(event, d) {
-                const content = d.data.content;
-                const response = d.data.response || '';
+                const content = d.content;
+                const response = d.response;
                 
-                let tooltipContent = `<strong>Type:</strong> \${d.type}<br>`;
-                tooltipContent += `<strong>Content:</strong> \${content}<br>`;
+                let tooltipContent = `<strong>Type:</strong> ${d.type}<br>`;
+                tooltipContent += `<strong>Content:</strong> ${content}<br>`;
                 
                 if (response) {
-                    tooltipContent += `<strong>Response:</strong> \${response.substring(0, 150)}...`;
+                    tooltipContent += `<strong>Response:</strong> ${response.substring(0, 150)}...`;
                 }
                 
                 tooltip.html(tooltipContent)
@@ -225,70 +300,263 @@ def generate_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any],
                 tooltip.style('display', 'none');
             }
             
-            // Update positions on each tick of the simulation
-            simulation.on('tick', () => {
-                link
-                    .attr('x1', d => d.source.x)
-                    .attr('y1', d => d.source.y)
-                    .attr('x2', d => d.target.x)
-                    .attr('y2', d => d.target.y);
-                
-                node.attr('transform', d => `translate(\${d.x}, \${d.y})`);
-            });
+            canvas
+                .on('mousemove', (event) => {
+                    const [x, y] = transform.invert(d3.pointer(event));
+                    const d = findNode(x, y);
+                    canvas.style('cursor', d ? 'pointer' : null);
+                    if (d) {
+                        showTooltip(event, d);
+                    } else {
+                        hideTooltip();
+                    }
+                })
+                .on('mouseleave', hideTooltip);
+            
+            // Drag functions. The drag subject carries the node's screen position so
+            // pointer movement is converted back to graph coordinates under zoom.
+            function dragsubject(event) {
+                const [x, y] = transform.invert([event.x, event.y]);
+                const d = findNode(x, y);
+                if (d) {
+                    return {node: d, x: transform.applyX(d.x), y: transform.applyY(d.y)};
+                }
+                return undefined;
+            }
             
-            // Drag functions
-            function dragstarted(event, d) {
-                if (!event.active) simulation.alphaTarget(0.3).restart();
-                d.fx = d.x;
-                d.fy = d.y;
+            function dragstarted(event) {
+                if (!event.active && !paused) {
+                    simulation.alphaTarget(0.3).restart();
+                    setRunning(true);
+                }
+                event.subject.node.fx = event.subject.node.x;
+                event.subject.node.fy = event.subject.node.y;
             }
             
-            function dragged(event, d) {
-                d.fx = event.x;
-                d.fy = event.y;
+            function dragged(event) {
+                const [x, y] = transform.invert([event.x, event.y]);
+                event.subject.node.fx = x;
+                event.subject.node.fy = y;
+                
+                // With the simulation paused, move the node directly
+                if (paused) {
+                    event.subject.node.x = x;
+                    event.subject.node.y = y;
+                    nodeIndex = null;
+                    scheduleDraw();
+                }
             }
             
-            function dragended(event, d) {
+            function dragended(event) {
                 if (!event.active) simulation.alphaTarget(0);
-                d.fx = null;
-                d.fy = null;
+                event.subject.node.fx = null;
+                event.subject.node.fy = null;
             }
             
+            // Dragging a node takes precedence over panning, so register it first
+            canvas.call(d3.drag()
+                .container(canvas.node())
+                .subject(dragsubject)
+                .on('start', dragstarted)
+                .on('drag', dragged)
+                .on('end', dragended));
+            
+            // Set up zoom behavior
+            const zoom = d3.zoom()
+                .scaleExtent([0.1, 4])
+                .on('zoom', (event) => {
+                    transform = event.transform;
+                    scheduleDraw();
+                });
+            
+            canvas.call(zoom);
+            
             // Set up control buttons
             document.getElementById('zoom-in').addEventListener('click', () => {
-                svg.transition().call(zoom.scaleBy, 1.5);
+                canvas.transition().call(zoom.scaleBy, 1.5);
             });
             
             document.getElementById('zoom-out').addEventListener('click', () => {
-                svg.transition().call(zoom.scaleBy, 0.75);
+                canvas.transition().call(zoom.scaleBy, 0.75);
             });
             
             document.getElementById('reset').addEventListener('click', () => {
-                svg.transition().call(zoom.transform, d3.zoomIdentity);
+                canvas.transition().call(zoom.transform, d3.zoomIdentity);
+            });
+            
+            // Pausing also keeps dragging from restarting the simulation; resuming
+            // reheats it so it runs until it settles again
+            pauseButton.addEventListener('click', () => {
+                paused = running;
+                if (paused) {
+                    simulation.stop();
+                } else {
+                    simulation.alpha(Math.max(simulation.alpha(), 0.3)).restart();
+                }
+                setRunning(!paused);
             });
         </script>
     </body>
     </html>
     """
+
+def _compact_template(template: str) -> str:
+    """Strip indentation, blank lines and whole-line // comments from the template.
+    
+    Line breaks are kept so JavaScript statement boundaries are unaffected.
+    """
+    lines = (line.strip() for line in template.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+# The static parts of the page, pre-encoded so they can be written as-is
+_HTML_HEAD, _rest = _compact_template(_HTML_TEMPLATE).encode("utf-8").split(b"__TITLE__")
+_HTML_BEFORE_D3, _rest = _rest.split(b"__D3__")
+_HTML_BEFORE_NODES, _rest = _rest.split(b"__NODES__")
+_HTML_BEFORE_LINKS, _HTML_TAIL = _rest.split(b"__LINKS__")
+del _rest
+
+_D3_CDN_SCRIPT = b'<script src="https://d3js.org/d3.v7.min.js"></script>'
+
+@lru_cache(maxsize=4)
+def _d3_script(d3_path: Optional[str]) -> bytes:
+    """Get the script tag loading D3, inlining the local copy at d3_path if given.
+    
+    Args:
+        d3_path (Optional[str]): Path to a local d3.v7.min.js, or None to use the CDN
+        
+    Returns:
+        bytes: The script tag
+    """
+    if d3_path is None:
+        return _D3_CDN_SCRIPT
+    with open(d3_path, 'rb') as f:
+        source = f.read()
+    return b"<script>" + source.replace(b"</script", b"<\\/script") + b"</script>"
+
+def _to_json(data: Any) -> bytes:
+    """Serialize data as compact UTF-8 JSON that is safe to embed in a script tag."""
+    if orjson is not None:
+        json_bytes = orjson.dumps(data)
+    else:
+        json_bytes = json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return json_bytes.replace(b"</", b"<\\/")
+
+def _truncate(text: str, max_chars: Optional[int]) -> str:
+    """Truncate text to max_chars characters, marking truncation with an ellipsis."""
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return f"{text[:max_chars]}…"
+
+def _iter_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any], title: str,
+                     max_field_chars: Optional[int], d3_path: Optional[str]) -> Iterator[bytes]:
+    """Yield the UTF-8 encoded HTML visualization of the research graph piece by piece.
+    
+    Args:
+        nodes (Dict[str, Dict[str, Any]]): Dictionary of graph nodes
+        edges (Dict[str, Any]): Dictionary of graph edges
+        title (str): Title for the visualization
+        max_field_chars (Optional[int]): Maximum characters of each node's content and
+            response to embed, or None to embed them in full
+        d3_path (Optional[str]): Path to a local D3 build to inline, or None to load D3
+            from the CDN
+        
+    Yields:
+        bytes: Consecutive pieces of the HTML document
+    """
+    # Convert nodes and edges to column lists, so field names are not repeated
+    # for every node and link. Links refer to nodes by their index.
+    node_index = {node_id: i for i, node_id in enumerate(nodes)}
+    node_columns = {
+        "ids": list(nodes),
+        "types": [node_data.get("type", "unknown") for node_data in nodes.values()],
+        "contents": [_truncate(node_data.get("content", ""), max_field_chars) for node_data in nodes.values()],
+        "responses": [_truncate(node_data.get("response", ""), max_field_chars) for node_data in nodes.values()],
+    }
     
-    return html_content
+    link_columns = {"source": [], "target": [], "state": []}
+    for source, targets in edges.items():
+        for target in targets:
+            # Skip edges to nodes that are not part of the graph
+            if source in node_index and target["name"] in node_index:
+                link_columns["source"].append(node_index[source])
+                link_columns["target"].append(node_index[target["name"]])
+                link_columns["state"].append(int(target["state"]))
+    
+    # Splice the data into the static page
+    yield _HTML_HEAD
+    yield title.encode("utf-8")
+    yield _HTML_BEFORE_D3
+    yield _d3_script(d3_path)
+    yield _HTML_BEFORE_NODES
+    yield _to_json(node_columns)
+    yield _HTML_BEFORE_LINKS
+    yield _to_json(link_columns)
+    yield _HTML_TAIL
+
+def generate_graph_html(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any], title: str = "Research Graph",
+                        max_field_chars: Optional[int] = 200, d3_path: Optional[str] = None) -> str:
+    """Generate an HTML visualization of the research graph.
+    
+    Args:
+        nodes (Dict[str, Dict[str, Any]]): Dictionary of graph nodes
+        edges (Dict[str, Any]): Dictionary of graph edges
+        title (str, optional): Title for the visualization. Defaults to "Research Graph".
+        max_field_chars (Optional[int], optional): Maximum characters of each node's content
+            and response to embed; the page only shows their beginning. None embeds them
+            in full. Defaults to 200.
+        d3_path (Optional[str], optional): Path to a local copy of d3.v7.min.js to inline,
+            so the page opens without a network fetch. Defaults to None, which loads D3
+            from the CDN.
+        
+    Returns:
+        str: HTML content for visualizing the graph
+    """
+    return b"".join(_iter_graph_html(nodes, edges, title, max_field_chars, d3_path)).decode("utf-8")
 
 def save_graph_visualization(nodes: Dict[str, Dict[str, Any]], edges: Dict[str, Any], 
-                            output_path: str, title: str = "Research Graph"):
+                            output_path: str, title: str = "Research Graph",
+                            compress: bool = False, max_field_chars: Optional[int] = 200,
+                            d3_path: Optional[str] = None):
     """Save the graph visualization to an HTML file.
     
     Args:
         nodes (Dict[str, Dict[str, Any]]): Dictionary of graph nodes
         edges (Dict[str, Any]): Dictionary of graph edges
-        output_path (str): Path to save the HTML file
+        output_path (str): Path to save the HTML file. Paths ending in ".gz" are written
+            gzip-compressed and paths ending in ".br" Brotli-compressed, e.g. for serving
+            with a matching Content-Encoding.
         title (str, optional): Title for the visualization. Defaults to "Research Graph".
+        compress (bool, optional): Write a gzip-compressed file to output_path + ".gz"
+            instead. Has no effect when output_path already ends in ".gz" or ".br".
+            Defaults to False.
+        max_field_chars (Optional[int], optional): Maximum characters of each node's content
+            and response to embed. None embeds them in full. Defaults to 200.
+        d3_path (Optional[str], optional): Path to a local copy of d3.v7.min.js to inline,
+            so the page opens offline. Defaults to None, which loads D3 from the CDN.
+            
+    Raises:
+        ImportError: If a ".br" path is given and the brotli package is not installed
     """
-    html_content = generate_graph_html(nodes, edges, title)
+    if compress and not output_path.endswith((".gz", ".br")):
+        output_path += ".gz"
+    
+    # Ensure the directory exists; a bare file name goes in the working directory
+    output_dir = os.path.dirname(output_path)
+    if output_dir and not os.path.isdir(output_dir):
+        os.makedirs(output_dir, exist_ok=True)
     
-    # Ensure the directory exists
-    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    if output_path.endswith(".br"):
+        if brotli is None:
+            raise ImportError("Saving a .br visualization requires the brotli package: pip install brotli")
+        with open(output_path, 'wb') as f:
+            f.write(brotli.compress(b"".join(_iter_graph_html(nodes, edges, title, max_field_chars, d3_path))))
+        return
     
-    # Write the HTML file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    # Write the already encoded page piece by piece rather than building it first
+    if output_path.endswith(".gz"):
+        f = gzip.open(output_path, 'wb', compresslevel=6)
+    else:
+        f = open(output_path, 'wb')
+    with f:
+        f.writelines(_iter_graph_html(nodes, edges, title, max_field_chars, d3_path))
 
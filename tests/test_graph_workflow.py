@@ -0,0 +1,66 @@
+"""Unit tests for the helpers of the graph-based research workflow."""
+
+import asyncio
+
+import pytest
+
+from open_deep_research.configuration import Configuration
+from open_deep_research.graph_workflow import (
+    _REJECTION_FEEDBACK,
+    _coerce_feedback,
+    generate_final_response,
+    generate_sub_questions,
+)
+
+
+def test_coerce_feedback_keeps_text():
+    assert _coerce_feedback("Focus on costs") == "Focus on costs"
+
+
+@pytest.mark.parametrize("rejection", [False, None, "", "   "])
+def test_coerce_feedback_turns_bare_rejection_into_an_instruction(rejection):
+    assert _coerce_feedback(rejection) == _REJECTION_FEEDBACK
+
+
+def test_coerce_feedback_stringifies_other_values():
+    assert _coerce_feedback({"note": "shorter"}) == "{'note': 'shorter'}"
+
+
+class RecordingAgent:
+    """Graph agent stand-in that records how sub-questions are requested."""
+
+    def __init__(self):
+        self.configurable = Configuration()
+        self.calls = []
+
+    async def generate_sub_questions(self, topic, num_questions, feedback, use_cache=None):
+        self.calls.append((feedback, use_cache))
+        return ["What is A?"]
+
+    async def generate_final_response(self, feedback, use_cache=None, on_partial=None):
+        for piece in ("# Report", "\n\nBody"):
+            on_partial(piece)
+        return "# Report\n\nBody"
+
+    def get_visualization_data(self):
+        return {"root": {"content": "topic", "type": "root"}}, {"root": []}
+
+
+@pytest.mark.parametrize("feedback, use_cache", [
+    (None, None),
+    ("More on costs", None),
+    (_REJECTION_FEEDBACK, False),
+])
+def test_generate_sub_questions_only_forces_regeneration_on_bare_rejection(feedback, use_cache):
+    agent = RecordingAgent()
+    state = {"topic": "topic", "graph_agent": agent, "feedback_on_questions": feedback}
+    asyncio.run(generate_sub_questions(state, {}))
+    assert agent.calls == [(feedback, use_cache)]
+
+
+def test_generate_final_response_streams_report_to_custom_stream(tmp_path):
+    events = []
+    state = {"graph_agent": RecordingAgent(), "visualization_path": str(tmp_path / "graph.html")}
+    result = asyncio.run(generate_final_response(state, {}, events.append))
+    assert events == [{"report_partial": "# Report"}, {"report_partial": "\n\nBody"}]
+    assert result == {"final_report": "# Report\n\nBody"}
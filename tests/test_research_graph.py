@@ -0,0 +1,236 @@
+"""Unit tests for the graph-based research agent, with the model and search mocked."""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+import open_deep_research.research_graph as research_graph
+from open_deep_research.research_graph import (
+    GraphResearchAgent,
+    _cached_ainvoke,
+    _parse_questions,
+    _truncate_result,
+)
+
+
+class FakeChatModel:
+    """Chat model returning a fixed response and counting its calls."""
+
+    def __init__(self, content: str):
+        self.content = content
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        return AIMessage(content=self.content)
+
+    async def astream(self, messages):
+        self.calls += 1
+        for i in range(0, len(self.content), 4):
+            yield AIMessage(content=self.content[i:i + 4])
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    """Patch init_chat_model to return a fake model and isolate the module caches."""
+    model = FakeChatModel("1. What is A?\n2. What is B?\n3. What is C?")
+    monkeypatch.setattr(research_graph, "init_chat_model", lambda **kwargs: model)
+    monkeypatch.setattr(research_graph, "_CHAT_MODELS", {})
+    monkeypatch.setattr(research_graph, "_RESPONSE_CACHE", {})
+    return model
+
+
+@pytest.fixture
+def search_calls(monkeypatch):
+    """Patch select_and_execute_search and record the queries it receives."""
+    calls = []
+
+    async def fake_search(search_api, query_list, params_to_pass):
+        calls.append(list(query_list))
+        return f"results for {query_list[0]}"
+
+    monkeypatch.setattr(research_graph, "select_and_execute_search", fake_search)
+    return calls
+
+
+def test_cached_ainvoke_reuses_identical_prompt(fake_model):
+    messages = [HumanMessage(content="same prompt")]
+    first = asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), messages))
+    second = asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), messages))
+    assert first == second == fake_model.content
+    assert fake_model.calls == 1
+
+
+def test_cached_ainvoke_misses_on_different_prompt_or_model(fake_model):
+    asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), [HumanMessage(content="one")]))
+    asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), [HumanMessage(content="two")]))
+    asyncio.run(_cached_ainvoke(fake_model, ("p", "other", "[]"), [HumanMessage(content="one")]))
+    assert fake_model.calls == 3
+
+
+def test_cached_ainvoke_bypass_calls_model_and_refreshes_cache(fake_model):
+    messages = [HumanMessage(content="prompt")]
+    asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), messages))
+    fake_model.content = "regenerated"
+    assert asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), messages, use_cache=False)) == "regenerated"
+    assert asyncio.run(_cached_ainvoke(fake_model, ("p", "m", "[]"), messages)) == "regenerated"
+    assert fake_model.calls == 2
+
+
+def test_generate_sub_questions_regenerates_without_cache(fake_model):
+    agent = GraphResearchAgent({"configurable": {}})
+    asyncio.run(agent.generate_sub_questions("topic", 3))
+    asyncio.run(agent.generate_sub_questions("topic", 3))
+    assert fake_model.calls == 1
+    asyncio.run(agent.generate_sub_questions("topic", 3, "", use_cache=False))
+    assert fake_model.calls == 2
+
+
+def test_generate_sub_questions_reuses_result_for_repeated_feedback(fake_model):
+    agent = GraphResearchAgent({"configurable": {}})
+    asyncio.run(agent.generate_sub_questions("topic", 3))
+    asyncio.run(agent.generate_sub_questions("topic", 3, "More on costs"))
+    asyncio.run(agent.generate_sub_questions("topic", 3, "More on costs"))
+    assert fake_model.calls == 2
+    asyncio.run(agent.generate_sub_questions("topic", 3, "More on risks"))
+    assert fake_model.calls == 3
+
+
+def test_regeneration_evicts_the_rejected_response(fake_model):
+    fake_model.content = "1. Rejected question?"
+    agent = GraphResearchAgent({"configurable": {}})
+    asyncio.run(agent.generate_sub_questions("topic", 3))
+    fake_model.content = "1. Better question?"
+    asyncio.run(agent.generate_sub_questions("topic", 3, "More on costs"))
+    assert fake_model.calls == 2
+
+    # A new run on the same topic must not get the rejected questions back
+    fake_model.content = "1. Fresh question?"
+    questions = asyncio.run(GraphResearchAgent({"configurable": {}}).generate_sub_questions("topic", 3))
+    assert questions == ["Fresh question?"]
+    assert fake_model.calls == 3
+
+
+def test_accepted_response_stays_cached_for_new_runs(fake_model):
+    asyncio.run(GraphResearchAgent({"configurable": {}}).generate_sub_questions("topic", 3))
+    asyncio.run(GraphResearchAgent({"configurable": {}}).generate_sub_questions("topic", 3))
+    assert fake_model.calls == 1
+
+
+def test_final_response_streams_report_pieces(fake_model):
+    fake_model.content = "x" * 200
+    agent = GraphResearchAgent({"configurable": {}})
+    pieces = []
+    report = asyncio.run(agent.generate_final_response(on_partial=pieces.append))
+    queued = []
+    while not agent.graph.search_results_queue.empty():
+        name, node, _ = agent.graph.search_results_queue.get_nowait()
+        if name == "response_partial":
+            queued.append(node["content"])
+    assert "".join(pieces) == report
+    assert queued == pieces
+    assert max(len(piece) for piece in pieces) < len(report)
+
+
+def test_parse_questions_strips_markers_and_emphasis():
+    content = (
+        "Here are the sub-questions:\n"
+        "1. What is X?\n"
+        "2. **How does Y affect Z?**\n"
+        "**3. Where is W?**\n"
+        "- *Who is involved?*\n"
+        "This line is not a question.\n"
+    )
+    assert _parse_questions(content) == [
+        "What is X?",
+        "How does Y affect Z?",
+        "Where is W?",
+        "Who is involved?",
+    ]
+
+
+@pytest.mark.parametrize("line, question", [
+    ("1. Is it A? Or is it B?", "Is it A? Or is it B?"),
+    ("1. What is X? This includes cloud and edge.", "What is X? This includes cloud and edge."),
+    ("1. What is X? [Economics]", "What is X? [Economics]"),
+    ("3) Why does it matter? (consider economics)", "Why does it matter? (consider economics)"),
+    ('1. What are the costs?" ', 'What are the costs?"'),
+])
+def test_parse_questions_keeps_lines_with_text_after_the_question_mark(line, question):
+    assert _parse_questions(line) == [question]
+
+
+def test_search_node_names_returns_a_copy_in_insertion_order(fake_model, search_calls):
+    agent = GraphResearchAgent({"configurable": {}})
+    asyncio.run(agent.initialize_with_topic("topic"))
+    asyncio.run(agent.graph.add_search_node("question_2", "B?", search_api="tavily"))
+    asyncio.run(agent.graph.add_search_node("question_1", "A?", search_api="tavily"))
+    names = agent.graph.search_node_names()
+    names.append("other")
+    assert agent.graph.search_node_names() == ["question_2", "question_1"]
+
+
+def _formatted_sources(*bodies):
+    """Build search results in the format produced by deduplicate_and_format_sources."""
+    text = "Content from sources:\n"
+    for i, body in enumerate(bodies, 1):
+        text += f"{'=' * 80}\nSource: Title {i}\n{'-' * 80}\nURL: https://example.com/{i}\n===\n"
+        text += f"Most relevant content from source: {body}\n===\n{'=' * 80}\n\n"
+    return text.strip()
+
+
+def test_truncate_result_leaves_short_results_unchanged():
+    results = _formatted_sources("short", "also short")
+    assert _truncate_result(results, len(results)) == results
+
+
+def test_truncate_result_keeps_every_source_header_within_the_cap():
+    results = _formatted_sources("a" * 5000, "b" * 5000, "c" * 5000)
+    truncated = _truncate_result(results, 3000)
+    assert len(truncated) <= 3000
+    for i in (1, 2, 3):
+        assert f"Source: Title {i}" in truncated
+        assert f"URL: https://example.com/{i}" in truncated
+
+
+def test_truncate_result_only_shortens_long_sources():
+    results = _formatted_sources("short", "x" * 10000)
+    truncated = _truncate_result(results, 2000)
+    assert len(truncated) <= 2000
+    assert "Most relevant content from source: short\n" in truncated
+    assert truncated.count("...[truncated]") == 1
+
+
+@pytest.mark.parametrize("max_chars", [0, 5, 16, 17, 40])
+def test_truncate_result_never_exceeds_small_caps(max_chars):
+    results = _formatted_sources("a" * 500, "b" * 500)
+    assert len(_truncate_result(results, max_chars)) <= max_chars
+
+
+def test_add_search_node_reads_cap_from_config_with_explicit_search_api(monkeypatch):
+    async def long_search(search_api, query_list, params_to_pass):
+        return "z" * 1000
+
+    monkeypatch.setattr(research_graph, "select_and_execute_search", long_search)
+    graph = research_graph.ResearchGraph()
+    config = {"configurable": {"max_chars_per_result": 100}}
+    results = asyncio.run(graph.add_search_node("question_1", "A?", config, search_api="tavily"))
+    assert len(results) <= 100
+
+
+def test_truncate_result_cuts_unstructured_text_at_the_cap():
+    truncated = _truncate_result("y" * 1000, 100)
+    assert len(truncated) <= 100
+    assert truncated.startswith("y")
+
+
+def test_expand_graph_with_questions_searches_each_question_once(fake_model, search_calls):
+    agent = GraphResearchAgent({"configurable": {"search_api": "tavily"}})
+    asyncio.run(agent.initialize_with_topic("topic"))
+    asyncio.run(agent.expand_graph_with_questions(
+        ["What is A?", "what is  a?", "What is B?", " WHAT IS A? "]
+    ))
+    assert search_calls == [["What is A?"], ["What is B?"]]
+    assert agent.graph.search_node_names() == ["question_1", "question_2"]
+    assert agent.graph.node("question_2")["content"] == "What is B?"
@@ -0,0 +1,69 @@
+"""Unit tests for the research graph visualization page."""
+
+import gzip
+import json
+import re
+
+from open_deep_research.visualization import _iter_graph_html, save_graph_visualization
+
+NODES = {
+    "root": {"content": "Topic", "type": "root"},
+    "question_1": {"content": "What is A?", "type": "search", "response": "A is a letter."},
+}
+EDGES = {
+    "root": [{"id": "e1", "name": "question_1", "state": 2}],
+    "question_1": [],
+}
+
+
+def test_compress_adds_gz_suffix(tmp_path):
+    save_graph_visualization(NODES, EDGES, str(tmp_path / "graph.html"), compress=True)
+    assert [p.name for p in tmp_path.iterdir()] == ["graph.html.gz"]
+    assert b"What is A?" in gzip.decompress((tmp_path / "graph.html.gz").read_bytes())
+
+
+def test_compress_keeps_an_existing_gz_suffix(tmp_path):
+    save_graph_visualization(NODES, EDGES, str(tmp_path / "graph.html.gz"), compress=True)
+    assert [p.name for p in tmp_path.iterdir()] == ["graph.html.gz"]
+    assert b"What is A?" in gzip.decompress((tmp_path / "graph.html.gz").read_bytes())
+
+
+def _payload(nodes, edges, max_field_chars=200):
+    """Render the page and return its embedded node and link columns."""
+    html = b"".join(_iter_graph_html(nodes, edges, "Test", max_field_chars, None)).decode("utf-8")
+    node_columns = re.search(r"const nodeColumns = (.*?);\n", html).group(1)
+    link_columns = re.search(r"const linkColumns = (.*?);\n", html).group(1)
+    return html, json.loads(node_columns), json.loads(link_columns)
+
+
+def test_payload_links_refer_to_node_indices():
+    nodes = dict(NODES, response={"content": "Report", "type": "response"})
+    edges = dict(EDGES, question_1=[{"id": "e2", "name": "response", "state": 1}])
+    _, node_columns, link_columns = _payload(nodes, edges)
+    assert node_columns["ids"] == ["root", "question_1", "response"]
+    assert node_columns["types"] == ["root", "search", "response"]
+    assert link_columns == {"source": [0, 1], "target": [1, 2], "state": [2, 1]}
+
+
+def test_payload_skips_edges_to_missing_nodes():
+    edges = {
+        "root": [{"id": "e1", "name": "question_1", "state": 2}, {"id": "e2", "name": "gone", "state": 2}],
+        "question_1": [],
+        "missing": [{"id": "e3", "name": "root", "state": 2}],
+    }
+    _, _, link_columns = _payload(NODES, edges)
+    assert link_columns == {"source": [0], "target": [1], "state": [2]}
+
+
+def test_payload_escapes_closing_tags():
+    nodes = {"root": {"content": "</script><script>alert(1)</script>", "type": "root"}}
+    html, node_columns, _ = _payload(nodes, {"root": []})
+    assert "</script><script>alert(1)" not in html
+    assert node_columns["contents"] == ["</script><script>alert(1)</script>"]
+
+
+def test_payload_truncates_long_fields():
+    nodes = {"root": {"content": "x" * 50, "type": "root", "response": "y" * 50}}
+    _, node_columns, _ = _payload(nodes, {"root": []}, max_field_chars=10)
+    assert node_columns["contents"] == ["x" * 10 + "\u2026"]
+    assert node_columns["responses"] == ["y" * 10 + "\u2026"]